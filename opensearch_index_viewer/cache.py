@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+OpenSearch Index Viewer - Persistent cache of exported index summaries
+"""
+
+import dbm
+import functools
+import hashlib
+import json
+import os
+import stat
+import zlib
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, Optional, cast
+
+from . import __version__
+
+orjson: Optional[ModuleType]
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speed-up
+    orjson = None
+
+try:
+    from lz4 import frame as lz4_frame
+except ImportError:  # pragma: no cover - lz4 is an optional speed-up
+    lz4_frame = None
+
+# One-byte prefix recording how a cache entry was compressed
+_LZ4 = b"L"
+_ZLIB = b"Z"
+
+# Identifies the file version (and tool version) a database's entries belong to
+_STAMP_KEY = b"stamp"
+
+
+def default_cache_dir() -> Path:
+    """Get the cache directory ($OSIV_CACHE_DIR, else the user cache dir)."""
+    if os.environ.get("OSIV_CACHE_DIR"):
+        return Path(os.environ["OSIV_CACHE_DIR"])
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "opensearch-index-viewer"
+
+
+@functools.lru_cache(maxsize=16)
+def _file_digest(path: str, mtime_ns: int, size: int) -> str:
+    """SHA256 of a file version; cached so a file is hashed once per change."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()[:32]
+
+
+def _encode(summary: Dict[str, Any]) -> bytes:
+    """Serialize a summary as compact JSON, with orjson when available."""
+    if orjson is not None:
+        return cast(bytes, orjson.dumps(summary))
+    return json.dumps(summary, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _decode(payload: bytes) -> Dict[str, Any]:
+    """Deserialize a summary written by _encode."""
+    if orjson is not None:
+        return cast(Dict[str, Any], orjson.loads(payload))
+    return cast(Dict[str, Any], json.loads(payload))
+
+
+def _compress(payload: bytes) -> bytes:
+    """Compress an entry with lz4 when available, else zlib."""
+    if lz4_frame is not None:
+        return _LZ4 + cast(bytes, lz4_frame.compress(payload))
+    return _ZLIB + zlib.compress(payload)
+
+
+def _decompress(blob: bytes) -> bytes:
+    """Decompress an entry written by _compress."""
+    codec, payload = blob[:1], blob[1:]
+    if codec == _LZ4:
+        if lz4_frame is None:
+            raise ValueError("Entry was written with lz4, which is not installed")
+        return cast(bytes, lz4_frame.decompress(payload))
+    return zlib.decompress(payload)
+
+
+class SummaryCache:
+    """dbm-backed cache of export summaries, keyed by file content and index.
+
+    Each input path gets its own small database holding the summaries of
+    one version of that file. Storing a summary for a changed file (or from
+    another release of this tool) starts that database afresh, so stale
+    entries never accumulate.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self.cache_dir = cache_dir or default_cache_dir()
+
+    def get(self, file_path: Path, index_name: str) -> Optional[Dict[str, Any]]:
+        """Get the cached summary for an index, or None on a miss."""
+        try:
+            file_stat = file_path.stat()
+            if not stat.S_ISREG(file_stat.st_mode):
+                return None
+            stamp = self._stamp(file_path, file_stat)
+            with dbm.open(self._db_path(file_path), 'r') as db:
+                if db.get(_STAMP_KEY) != stamp:
+                    return None
+                blob = db.get(self._key(index_name))
+            if blob is None:
+                return None
+            return _decode(_decompress(blob))
+        except Exception:
+            # A missing, unreadable or stale cache is just a miss
+            return None
+
+    def set(self, file_path: Path, index_name: str, summary: Dict[str, Any]) -> None:
+        """Store the summary for an index; failures to write are ignored."""
+        try:
+            file_stat = file_path.stat()
+            if not stat.S_ISREG(file_stat.st_mode):
+                # Hashing a pipe would consume it before it is loaded
+                return
+            stamp = self._stamp(file_path, file_stat)
+            blob = _compress(_encode(summary))
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            db_path = self._db_path(file_path)
+            try:
+                with dbm.open(db_path, 'r') as db:
+                    current = db.get(_STAMP_KEY) == stamp
+            except dbm.error:
+                current = False
+            # 'n' truncates the database, dropping entries for older versions
+            with dbm.open(db_path, 'c' if current else 'n') as db:
+                db[_STAMP_KEY] = stamp
+                db[self._key(index_name)] = blob
+        except (*dbm.error, TypeError):
+            pass
+
+    def _db_path(self, file_path: Path) -> str:
+        """Get the database holding the summaries for an input path."""
+        name = hashlib.sha256(os.fsencode(os.path.abspath(file_path))).hexdigest()[:32]
+        return str(self.cache_dir / name)
+
+    @staticmethod
+    def _key(index_name: str) -> bytes:
+        """Build the entry key for an index's summary."""
+        return f"index:{index_name}".encode()
+
+    @staticmethod
+    def _stamp(file_path: Path, file_stat: os.stat_result) -> bytes:
+        """Identify the package version, file mtime and file content hash."""
+        path = os.path.abspath(file_path)
+        digest = _file_digest(path, file_stat.st_mtime_ns, file_stat.st_size)
+        return f"{__version__}:{file_stat.st_mtime_ns}:{digest}".encode()
@@ -3,33 +3,209 @@
 OpenSearch Index Viewer - CLI interface
 """
 
+import functools
 import json
+import mmap
+import os
+import re
+import stat
 import sys
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Any, Optional
+from types import ModuleType
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Type, Union
 import typer
-from rich.console import Console
+from rich.console import Console, Group, RenderableType
 from rich.layout import Layout
+from rich.rule import Rule
+from rich.text import Text
 
+from .cache import SummaryCache
 from .viewer import OpenSearchIndexViewer
 
+orjson: Optional[ModuleType]
+simdjson: Optional[ModuleType]
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speed-up
+    orjson = None
+
+JSON_DECODE_ERRORS: Tuple[Type[Exception], ...] = (json.JSONDecodeError,)
+if orjson is not None:
+    JSON_DECODE_ERRORS += (orjson.JSONDecodeError,)
+
+try:
+    import simdjson
+except ImportError:  # pragma: no cover - pysimdjson is an optional speed-up
+    simdjson = None
+
 app = typer.Typer(help="OpenSearch Index Viewer - Clear visualization of index mappings")
 console = Console()
 
+_BLANK_LINE = Text("")
+
+# Start of a top-level JSON object, after optional whitespace
+_JSON_OBJECT_START = re.compile(rb'\s*\{')
+
+
+@contextmanager
+def _mapped_file(file_path: Path) -> Iterator[Union[bytes, memoryview]]:
+    """Memory-map a file read-only and yield its contents without copying."""
+    with open(file_path, 'rb') as f:
+        file_stat = os.fstat(f.fileno())
+        if not stat.S_ISREG(file_stat.st_mode) or file_stat.st_size == 0:
+            # Pipes and empty files cannot be mapped; read them instead
+            yield f.read()
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as buf:
+                yield buf
+
 
 def load_index_data(file_path: Path) -> Dict[str, Any]:
     """Load OpenSearch index data from JSON file."""
     try:
-        with open(file_path, 'r') as f:
-            return json.load(f)
+        if orjson is not None:
+            with _mapped_file(file_path) as buf:
+                data = orjson.loads(buf)
+        else:
+            with open(file_path, 'rb') as f:
+                data = json.load(f)
+    except FileNotFoundError:
+        console.print(f"❌ File not found: {file_path}", style="red")
+        raise typer.Exit(1)
+    except JSON_DECODE_ERRORS as e:
+        console.print(f"❌ Invalid JSON: {e}", style="red")
+        raise typer.Exit(1)
+    
+    if not isinstance(data, dict):
+        console.print("❌ Invalid JSON: top-level value is not an object", style="red")
+        raise typer.Exit(1)
+    return data
+
+
+def _parse_lazy(file_path: Path) -> Any:
+    """Parse a JSON file with pysimdjson, leaving values as lazy proxies."""
+    assert simdjson is not None
+    try:
+        with _mapped_file(file_path) as buf:
+            doc = simdjson.Parser().parse(buf)
+    except FileNotFoundError:
+        console.print(f"❌ File not found: {file_path}", style="red")
+        raise typer.Exit(1)
+    except ValueError as e:
+        console.print(f"❌ Invalid JSON: {e}", style="red")
+        raise typer.Exit(1)
+    
+    if not isinstance(doc, simdjson.Object):
+        console.print("❌ Invalid JSON: top-level value is not an object", style="red")
+        raise typer.Exit(1)
+    return doc
+
+
+def _materialize(value: Any) -> Any:
+    """Convert a pysimdjson proxy into plain Python objects."""
+    assert simdjson is not None
+    if isinstance(value, simdjson.Object):
+        return value.as_dict()
+    if isinstance(value, simdjson.Array):
+        return value.as_list()
+    return value
+
+
+def load_index_lazy(file_path: Path, index_names: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Load only the requested indexes from a JSON file.
+    
+    With pysimdjson installed, only the selected indexes are converted to
+    Python dicts; the rest of the document is never materialized. Loading
+    every index goes through load_index_data, which is faster for that.
+    """
+    if simdjson is None or index_names is None:
+        data = load_index_data(file_path)
+        if index_names is None:
+            return data
+        return {name: data[name] for name in index_names if name in data}
+    
+    doc = _parse_lazy(file_path)
+    return {name: _materialize(doc[name]) for name in index_names if name in doc}
+
+
+def _object_keys(pairs: List[Tuple[str, Any]]) -> List[str]:
+    """object_pairs_hook keeping only an object's keys, so values are dropped."""
+    return [key for key, _ in pairs]
+
+
+# Validates the whole document while materializing only each object's keys
+_KEYS_DECODER = json.JSONDecoder(object_pairs_hook=_object_keys)
+
+
+def top_level_keys(data: Union[bytes, memoryview]) -> List[str]:
+    """Extract the keys of a top-level JSON object without keeping its values.
+    
+    The document is fully validated by the stdlib decoder, but every object
+    is replaced by its list of keys as soon as it is parsed, so nested values
+    are released immediately. Duplicate keys are reported once, in order.
+    """
+    if not _JSON_OBJECT_START.match(data):
+        raise ValueError("Top-level JSON value is not an object")
+    
+    keys: List[str] = _KEYS_DECODER.decode(str(data, "utf-8"))
+    return list(dict.fromkeys(keys))
+
+
+def load_index_names(file_path: Path) -> List[str]:
+    """Load only the index names (top-level keys) from a JSON file."""
+    if simdjson is not None:
+        return list(_parse_lazy(file_path).keys())
+    
+    try:
+        with _mapped_file(file_path) as buf:
+            return top_level_keys(buf)
     except FileNotFoundError:
         console.print(f"❌ File not found: {file_path}", style="red")
         raise typer.Exit(1)
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         console.print(f"❌ Invalid JSON: {e}", style="red")
         raise typer.Exit(1)
 
 
+@functools.lru_cache(maxsize=4)
+def _load_viewer(
+    path: str, mtime_ns: int, size: int, index_names: Optional[Tuple[str, ...]]
+) -> OpenSearchIndexViewer:
+    """Build a viewer for a file version; cached by path, mtime and size."""
+    names = list(index_names) if index_names is not None else None
+    return OpenSearchIndexViewer(load_index_lazy(Path(path), names))
+
+
+def load_viewer(file_path: Path, index_names: Optional[List[str]] = None) -> OpenSearchIndexViewer:
+    """Get a viewer for a file, reusing parsed data while the file is unchanged."""
+    try:
+        file_stat = file_path.stat()
+    except FileNotFoundError:
+        console.print(f"❌ File not found: {file_path}", style="red")
+        raise typer.Exit(1)
+    
+    if not stat.S_ISREG(file_stat.st_mode):
+        # Pipes such as /dev/stdin can only be read once, so never cache them
+        return OpenSearchIndexViewer(load_index_lazy(file_path, index_names))
+    
+    names = tuple(index_names) if index_names is not None else None
+    return _load_viewer(os.path.abspath(file_path), file_stat.st_mtime_ns, file_stat.st_size, names)
+
+
+def _index_header(index_name: str, overview: RenderableType) -> List[RenderableType]:
+    """Build the rule and overview that open each index in view."""
+    return [
+        _BLANK_LINE,
+        Rule(f"[bold blue]📋 {index_name}[/bold blue]"),
+        _BLANK_LINE,
+        overview,
+        _BLANK_LINE,
+    ]
+
+
 @app.command()
 def view(
     file_path: Path = typer.Argument(..., help="Path to JSON file containing index data"),
@@ -39,12 +215,27 @@ def view(
     show_tree: bool = typer.Option(True, "--tree/--no-tree", help="Show field tree view"),
     show_summary: bool = typer.Option(True, "--summary/--no-summary", help="Show field types summary"),
     show_analyzers: bool = typer.Option(True, "--analyzers/--no-analyzers", help="Show analyzers table"),
+    use_cache: bool = typer.Option(False, "--cache", help="Cache export summaries on disk and reuse them"),
 ):
     """View OpenSearch index mappings in a clean, readable format."""
     
+    summary_cache = SummaryCache() if export and use_cache else None
+    
+    # Exporting one index with nothing else to show needs only its summary,
+    # so a cache hit skips loading the file altogether
+    only_export = not (search or show_tree or show_summary or show_analyzers)
+    if summary_cache is not None and export and index and only_export:
+        summary = summary_cache.get(file_path, index)
+        if summary is not None:
+            overview = OpenSearchIndexViewer.get_summary_overview(summary)
+            console.print(Group(*_index_header(index, overview)))
+            OpenSearchIndexViewer.write_summary(summary, export)
+            console.print(f"✅ Exported readable summary to: {export}", style="green")
+            return
+    
     # Load data
-    data = load_index_data(file_path)
-    viewer = OpenSearchIndexViewer(data)
+    viewer = load_viewer(file_path, [index] if index else None)
+    data = viewer.data
     
     # Determine which indexes to show
     indexes = [index] if index else list(data.keys())
@@ -58,35 +249,33 @@ def view(
             console.print(f"❌ Index '{idx_name}' not found", style="red")
             continue
         
-        console.print()
-        console.rule(f"[bold blue]📋 {idx_name}[/bold blue]")
-        console.print()
-        
-        # Show overview
-        console.print(viewer.get_index_overview(idx_name))
-        console.print()
+        # Collect the components and render them in a single pass
+        parts = _index_header(idx_name, viewer.get_index_overview(idx_name))
         
         # Search if pattern provided
         if search:
-            console.print(viewer.search_fields(idx_name, search))
-            console.print()
+            parts += [viewer.search_fields(idx_name, search), _BLANK_LINE]
         
         # Show components based on options
         if show_summary:
-            console.print(viewer.get_field_types_summary(idx_name))
-            console.print()
+            parts += [viewer.get_field_types_summary(idx_name), _BLANK_LINE]
         
         if show_analyzers:
-            console.print(viewer.get_analyzers_table(idx_name))
-            console.print()
+            parts += [viewer.get_analyzers_table(idx_name), _BLANK_LINE]
         
         if show_tree:
-            console.print(viewer.get_field_tree(idx_name))
-            console.print()
+            parts += [viewer.get_field_tree(idx_name), _BLANK_LINE]
+        
+        console.print(Group(*parts))
         
         # Export if requested
         if export:
-            viewer.export_readable_json(idx_name, export)
+            summary = summary_cache.get(file_path, idx_name) if summary_cache is not None else None
+            if summary is None:
+                summary = viewer.build_summary(idx_name)
+                if summary_cache is not None and summary is not None:
+                    summary_cache.set(file_path, idx_name, summary)
+            viewer.export_readable_json(idx_name, export, summary)
 
 
 @app.command()
@@ -94,14 +283,14 @@ def list_indexes(
     file_path: Path = typer.Argument(..., help="Path to JSON file containing index data")
 ):
     """List all indexes in the JSON file."""
-    data = load_index_data(file_path)
+    index_names = load_index_names(file_path)
     
-    if not data:
+    if not index_names:
         console.print("❌ No indexes found", style="red")
         return
     
     console.print("[bold blue]📋 Available Indexes:[/bold blue]")
-    for i, index_name in enumerate(data.keys(), 1):
+    for i, index_name in enumerate(index_names, 1):
         console.print(f"  {i}. [cyan]{index_name}[/cyan]")
 
 
@@ -112,8 +301,8 @@ def compare(
     index2: str = typer.Argument(..., help="Second index to compare"),
 ):
     """Compare two indexes side by side."""
-    data = load_index_data(file_path)
-    viewer = OpenSearchIndexViewer(data)
+    viewer = load_viewer(file_path, [index1, index2])
+    data = viewer.data
     
     if index1 not in data or index2 not in data:
         console.print("❌ One or both indexes not found", style="red")
@@ -3,62 +3,340 @@
 OpenSearch Index Viewer - Core visualization functionality
 """
 
+import functools
 import json
+import re
+from collections import Counter, defaultdict
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple
+from types import ModuleType
+from typing import Callable, Dict, Any, List, NamedTuple, Optional, Tuple, TypeVar, cast
 from rich.console import Console
 from rich.table import Table
 from rich.tree import Tree
 from rich.panel import Panel
 from rich import box
 
+orjson: Optional[ModuleType]
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speed-up
+    orjson = None
+
+# Shared by all viewers; creating a Console probes the terminal each time
+_console = Console()
+
+# Type emoji mapping
+_TYPE_EMOJIS = {
+    "text": "📝",
+    "keyword": "🔤",
+    "date": "📅",
+    "long": "🔢",
+    "integer": "🔢",
+    "float": "🔢",
+    "double": "🔢",
+    "boolean": "✅",
+    "object": "📦",
+    "nested": "🔗"
+}
+
+# Label style based on type
+_TYPE_STYLES = {
+    "text": "cyan",
+    "keyword": "green",
+    "date": "magenta",
+    "long": "yellow",
+    "integer": "yellow",
+    "float": "yellow",
+    "double": "yellow"
+}
+
+
+def _dump_json(data: Dict[str, Any]) -> bytes:
+    """Serialize to 2-space indented, key-sorted UTF-8 JSON."""
+    if orjson is not None:
+        return cast(bytes, orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
+    return json.dumps(data, indent=2, sort_keys=True, ensure_ascii=False).encode("utf-8")
+
+
+def _literal_matches(
+    names: List[str], lower_names: List[str], folded: str, needle: str
+) -> List[str]:
+    """Find the names whose lower-cased form contains needle.
+    
+    lower_names runs parallel to names, and folded is lower_names joined with
+    newlines. Matches are located with C-level str.find/str.count scans over
+    that one string instead of a Python-level test per field.
+    """
+    if not needle:
+        # An empty needle would match at every newline, not once per name
+        return list(names)
+    
+    limit = len(names) // 16
+    matches: List[str] = []
+    index = 0
+    last = 0
+    pos = folded.find(needle)
+    while pos != -1:
+        if len(matches) > limit:
+            # Most fields match, so testing each one directly is cheaper
+            return [name for name, lower in zip(names, lower_names) if needle in lower]
+        index += folded.count("\n", last, pos)
+        matches.append(names[index])
+        last = folded.find("\n", pos)
+        if last == -1:
+            break
+        pos = folded.find(needle, last)
+    return matches
+
+
+def _clean_fields(properties: Dict[str, Any], field_types: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Build the exported per-field entries, leaving out None values.
+    
+    Entries are assembled key by key rather than built in full and then
+    filtered with a comprehension.
+    """
+    fields: Dict[str, Dict[str, Any]] = {}
+    
+    for (field_name, field_config), field_type in zip(properties.items(), field_types):
+        get = field_config.get
+        clean: Dict[str, Any] = {"type": field_type}
+        
+        value = get("analyzer")
+        if value is not None:
+            clean["analyzer"] = value
+        value = get("search_analyzer")
+        if value is not None:
+            clean["search_analyzer"] = value
+        value = get("normalizer")
+        if value is not None:
+            clean["normalizer"] = value
+        value = get("index", True)
+        if value is not None:
+            clean["indexed"] = value
+        value = get("doc_values", True)
+        if value is not None:
+            clean["doc_values"] = value
+        
+        clean["sub_fields"] = list(field_config["fields"]) if "fields" in field_config else []
+        fields[field_name] = clean
+    
+    return fields
+
+
+_Method = TypeVar("_Method", bound=Callable[..., Any])
+
+
+def _require_index(on_missing: Callable[..., Any]) -> Callable[[_Method], _Method]:
+    """Return on_missing(index_name, ...) instead of calling the method for unknown indexes."""
+    def decorator(method: _Method) -> _Method:
+        @functools.wraps(method)
+        def wrapper(self: "OpenSearchIndexViewer", index_name: str, *args: Any, **kwargs: Any) -> Any:
+            if index_name not in self.data:
+                return on_missing(index_name, *args, **kwargs)
+            return method(self, index_name, *args, **kwargs)
+        return cast(_Method, wrapper)
+    return decorator
+
+
+def _analyzers_table(index_name: str) -> Table:
+    """Create the empty analyzers table."""
+    table = Table(title=f"🔍 Analyzers - {index_name}", box=box.ROUNDED)
+    table.add_column("Name", style="cyan", no_wrap=True)
+    table.add_column("Type", style="green")
+    table.add_column("Tokenizer", style="yellow")
+    table.add_column("Filters", style="magenta")
+    return table
+
+
+def _field_types_table(index_name: str) -> Table:
+    """Create the empty field types summary table."""
+    table = Table(title=f"📊 Field Types Summary - {index_name}", box=box.ROUNDED)
+    table.add_column("Type", style="cyan")
+    table.add_column("Count", justify="right", style="green")
+    table.add_column("Percentage", justify="right", style="yellow")
+    table.add_column("Examples", style="dim")
+    return table
+
+
+def _search_table(index_name: str, pattern: str) -> Table:
+    """Create the empty search results table."""
+    table = Table(title=f"🔍 Search Results for '{pattern}' in {index_name}", box=box.ROUNDED)
+    table.add_column("Field", style="cyan")
+    table.add_column("Type", style="green")
+    table.add_column("Analyzer", style="yellow")
+    table.add_column("Properties", style="magenta")
+    return table
+
+
+def _with_row(table: Table, *cells: str) -> Table:
+    """Add a single row to a table and return it."""
+    table.add_row(*cells)
+    return table
+
+
+def _report_missing_export(index_name: str, *args: Any, **kwargs: Any) -> None:
+    """Report an export request for an unknown index."""
+    _console.print(f"❌ Index '{index_name}' not found", style="red")
+
+
+class _IndexContext(NamedTuple):
+    """Per-index state derived once and shared by all views of that index."""
+    
+    settings: Dict[str, Any]
+    mappings: Dict[str, Any]
+    properties: Dict[str, Any]
+
+
+class _FieldStats(NamedTuple):
+    """Per-index field columns and statistics, derived only by views that need them.
+    
+    field_names, field_types and lower_names are parallel lists, one entry
+    per top-level field in mapping order.
+    """
+    
+    field_names: List[str]
+    field_types: List[str]
+    lower_names: List[str]
+    type_counts: Counter[str]
+    type_examples: Dict[str, List[str]]
+
+
+def _format_overview_values(overview: Dict[str, Any]) -> Tuple[str, str]:
+    """Format the creation date and short UUID of a summary's "overview"."""
+    # Dumps store the epoch-millis creation date as a string or a number
+    creation_date = overview.get("creation_date")
+    if isinstance(creation_date, str) and creation_date.isdigit():
+        creation_date = int(creation_date)
+    if isinstance(creation_date, int):
+        created = datetime.fromtimestamp(creation_date / 1000).strftime("%Y-%m-%d %H:%M:%S")
+    else:
+        created = "Unknown" if creation_date is None else str(creation_date)
+    
+    uuid = overview.get("uuid")
+    uuid_short = "Unknown" if uuid is None else str(uuid)[:12]
+    return created, uuid_short
+
+
+def _overview_panel(
+    index_name: str, overview: Dict[str, Any], creation_date: str, uuid_short: str
+) -> Panel:
+    """Render the overview panel from a summary's "overview" and its formatted values."""
+    shards, replicas = (
+        "Unknown" if overview.get(key) is None else overview[key]
+        for key in ("shards", "replicas")
+    )
+    
+    # Build overview text
+    overview_text = f"""
+📊 [bold]Index Name:[/bold] {index_name}
+📈 [bold]Total Fields:[/bold] {overview["total_fields"]}
+🔧 [bold]Shards:[/bold] {shards}
+🔄 [bold]Replicas:[/bold] {replicas}
+📅 [bold]Created:[/bold] {creation_date}
+🆔 [bold]UUID:[/bold] {uuid_short}...
+    """.strip()
+    
+    return Panel(overview_text, title="🗂️  Index Overview", border_style="blue")
+
 
 class OpenSearchIndexViewer:
     """Clean, readable viewer for OpenSearch index configurations."""
     
     def __init__(self, data: Dict[str, Any]):
         self.data = data
-        self.console = Console()
+        # Memoized per viewer instance, so the caches are released with the viewer
+        self._index_ctx = functools.lru_cache(maxsize=None)(self._build_index_ctx)
+        self._field_stats = functools.lru_cache(maxsize=None)(self._build_field_stats)
+        self._folded_names = functools.lru_cache(maxsize=None)(self._build_folded_names)
+        self._overview_values = functools.lru_cache(maxsize=None)(self._build_overview_values)
     
-    def get_index_overview(self, index_name: str) -> Panel:
-        """Get a clean overview panel for an index."""
-        if index_name not in self.data:
-            return Panel(f"❌ Index '{index_name}' not found", style="red")
-        
+    def _build_index_ctx(self, index_name: str) -> _IndexContext:
+        """Look up the settings, mappings and properties of an index."""
         index_data = self.data[index_name]
         settings = index_data.get("settings", {}).get("index", {})
         mappings = index_data.get("mappings", {})
+        return _IndexContext(settings, mappings, mappings.get("properties", {}))
+    
+    def _build_field_stats(self, index_name: str) -> _FieldStats:
+        """Project an index's fields into columns and count their types.
+        
+        Kept out of _index_ctx so that views which only need settings or the
+        field count never walk the fields.
+        """
+        properties = self._index_ctx(index_name).properties
+        
+        # Project the per-field configs into parallel columns once
+        field_names = list(properties)
+        field_types = [fc.get("type", "object") for fc in properties.values()]
+        lower_names = [name.lower() for name in field_names]
+        
+        type_counts = Counter(field_types)
+        type_examples: Dict[str, List[str]] = defaultdict(list)
+        for field_name, field_type in zip(field_names, field_types):
+            examples = type_examples[field_type]
+            if len(examples) < 5:
+                examples.append(field_name)
+        
+        return _FieldStats(
+            field_names, field_types, lower_names, type_counts, dict(type_examples)
+        )
+    
+    def _build_folded_names(self, index_name: str) -> Optional[str]:
+        """Join an index's lower-cased field names for bulk substring search.
+        
+        Returns None when the names cannot be searched this way: a name
+        contains a newline, or is non-ASCII, where str.lower() and
+        re.IGNORECASE disagree.
+        """
+        lower_names = self._field_stats(index_name).lower_names
+        folded = "\n".join(lower_names)
+        if not folded.isascii() or folded.count("\n") != len(lower_names) - 1:
+            return None
+        return folded
+    
+    @_require_index(lambda index_name: Panel(f"❌ Index '{index_name}' not found", style="red"))
+    def get_index_overview(self, index_name: str) -> Panel:
+        """Get a clean overview panel for an index."""
+        return _overview_panel(
+            index_name, self._overview(index_name), *self._overview_values(index_name)
+        )
+    
+    @staticmethod
+    def get_summary_overview(summary: Dict[str, Any]) -> Panel:
+        """Get the overview panel for a summary built by build_summary.
+        
+        Lets a cached summary be displayed without loading the index data.
+        """
+        overview = summary["overview"]
+        return _overview_panel(
+            summary["index_name"], overview, *_format_overview_values(overview)
+        )
+    
+    def _overview(self, index_name: str) -> Dict[str, Any]:
+        """Collect the overview values shown in the panel and the summary."""
+        ctx = self._index_ctx(index_name)
+        settings = ctx.settings
+        return {
+            "total_fields": len(ctx.properties),
+            "shards": settings.get("number_of_shards"),
+            "replicas": settings.get("number_of_replicas"),
+            "creation_date": settings.get("creation_date"),
+            "uuid": settings.get("uuid")
+        }
+    
+    def _build_overview_values(self, index_name: str) -> Tuple[str, str]:
+        """Format the creation date and short UUID shown in an index overview.
         
-        # Count properties
-        properties = mappings.get("properties", {})
-        field_count = len(properties)
-        
-        # Get creation date
-        creation_date = settings.get("creation_date", "Unknown")
-        if creation_date != "Unknown" and creation_date.isdigit():
-            from datetime import datetime
-            creation_date = datetime.fromtimestamp(int(creation_date) / 1000).strftime("%Y-%m-%d %H:%M:%S")
-        
-        # Build overview text
-        overview_text = f"""
-📊 [bold]Index Name:[/bold] {index_name}
-📈 [bold]Total Fields:[/bold] {field_count}
-🔧 [bold]Shards:[/bold] {settings.get('number_of_shards', 'Unknown')}
-🔄 [bold]Replicas:[/bold] {settings.get('number_of_replicas', 'Unknown')}
-📅 [bold]Created:[/bold] {creation_date}
-🆔 [bold]UUID:[/bold] {settings.get('uuid', 'Unknown')[:12]}...
-        """.strip()
-        
-        return Panel(overview_text, title="🗂️  Index Overview", border_style="blue")
+        Kept out of _index_ctx so that only the overview pays for formatting.
+        """
+        return _format_overview_values(self._overview(index_name))
     
+    @_require_index(lambda index_name, max_depth=3: Tree("❌ Index not found"))
     def get_field_tree(self, index_name: str, max_depth: int = 3) -> Tree:
         """Create a clean tree view of fields."""
-        if index_name not in self.data:
-            tree = Tree("❌ Index not found")
-            return tree
-        
-        mappings = self.data[index_name].get("mappings", {})
-        properties = mappings.get("properties", {})
+        properties = self._index_ctx(index_name).properties
         
         tree = Tree(f"📋 [bold]{index_name}[/bold] Fields")
         
@@ -98,50 +376,18 @@ class OpenSearchIndexViewer:
     def _format_field_label(self, field_name: str, field_config: Dict[str, Any]) -> str:
         """Format a field label with type and key properties."""
         field_type = field_config.get("type", "object")
-        
-        # Type emoji mapping
-        type_emojis = {
-            "text": "📝",
-            "keyword": "🔤",
-            "date": "📅",
-            "long": "🔢",
-            "integer": "🔢",
-            "float": "🔢",
-            "double": "🔢",
-            "boolean": "✅",
-            "object": "📦",
-            "nested": "🔗"
-        }
-        
-        emoji = type_emojis.get(field_type, "❓")
-        
-        # Style based on type
-        if field_type in ["text"]:
-            style = "cyan"
-        elif field_type in ["keyword"]:
-            style = "green"
-        elif field_type in ["date"]:
-            style = "magenta"
-        elif field_type in ["long", "integer", "float", "double"]:
-            style = "yellow"
-        else:
-            style = "white"
+        emoji = _TYPE_EMOJIS.get(field_type, "❓")
+        style = _TYPE_STYLES.get(field_type, "white")
         
         return f"{emoji} [{style}]{field_name}[/{style}] ([dim]{field_type}[/dim])"
     
+    @_require_index(
+        lambda index_name: _with_row(_analyzers_table(index_name), "❌", "Index not found", "", "")
+    )
     def get_analyzers_table(self, index_name: str) -> Table:
         """Create a clean table of analyzers."""
-        table = Table(title=f"🔍 Analyzers - {index_name}", box=box.ROUNDED)
-        table.add_column("Name", style="cyan", no_wrap=True)
-        table.add_column("Type", style="green")
-        table.add_column("Tokenizer", style="yellow")
-        table.add_column("Filters", style="magenta")
-        
-        if index_name not in self.data:
-            table.add_row("❌", "Index not found", "", "")
-            return table
-        
-        settings = self.data[index_name].get("settings", {}).get("index", {})
+        table = _analyzers_table(index_name)
+        settings = self._index_ctx(index_name).settings
         analysis = settings.get("analysis", {})
         analyzers = analysis.get("analyzer", {})
         
@@ -149,93 +395,84 @@ class OpenSearchIndexViewer:
             table.add_row("ℹ️", "No custom analyzers", "", "")
             return table
         
-        for name, config in analyzers.items():
-            filters = ", ".join(config.get("filter", []))
-            table.add_row(
+        rows = [
+            (
                 name,
                 config.get("type", "custom"),
                 config.get("tokenizer", ""),
-                filters or "None"
+                ", ".join(config.get("filter", [])) or "None"
             )
+            for name, config in analyzers.items()
+        ]
+        add_row = table.add_row
+        for row in rows:
+            add_row(*row)
         
         return table
     
+    @_require_index(
+        lambda index_name: _with_row(_field_types_table(index_name), "❌", "0", "0%", "Index not found")
+    )
     def get_field_types_summary(self, index_name: str) -> Table:
         """Create a summary table of field types."""
-        table = Table(title=f"📊 Field Types Summary - {index_name}", box=box.ROUNDED)
-        table.add_column("Type", style="cyan")
-        table.add_column("Count", justify="right", style="green")
-        table.add_column("Percentage", justify="right", style="yellow")
-        table.add_column("Examples", style="dim")
-        
-        if index_name not in self.data:
-            table.add_row("❌", "0", "0%", "Index not found")
-            return table
-        
-        mappings = self.data[index_name].get("mappings", {})
-        properties = mappings.get("properties", {})
-        
-        # Count field types and collect examples
-        type_counts = {}
-        type_examples = {}
-        
-        for field_name, field_config in properties.items():
-            field_type = field_config.get("type", "object")
-            type_counts[field_type] = type_counts.get(field_type, 0) + 1
-            
-            if field_type not in type_examples:
-                type_examples[field_type] = []
-            if len(type_examples[field_type]) < 3:
-                type_examples[field_type].append(field_name)
-        
-        total_fields = len(properties)
+        table = _field_types_table(index_name)
+        stats = self._field_stats(index_name)
+        total_fields = len(self._index_ctx(index_name).properties)
         
         # Sort by count (descending)
-        sorted_types = sorted(type_counts.items(), key=lambda x: x[1], reverse=True)
+        sorted_types = stats.type_counts.most_common()
         
         for field_type, count in sorted_types:
             percentage = f"{(count / total_fields * 100):.1f}%" if total_fields > 0 else "0%"
-            examples = ", ".join(type_examples[field_type][:2])
-            if len(type_examples[field_type]) > 2:
-                examples += f" (+{len(type_examples[field_type]) - 2} more)"
+            type_examples = stats.type_examples[field_type][:3]
+            examples = ", ".join(type_examples[:2])
+            if len(type_examples) > 2:
+                examples += f" (+{len(type_examples) - 2} more)"
             
             table.add_row(field_type, str(count), percentage, examples)
         
         return table
     
+    @_require_index(
+        lambda index_name, pattern: _with_row(
+            _search_table(index_name, pattern), "❌", "Index not found", "", ""
+        )
+    )
     def search_fields(self, index_name: str, pattern: str) -> Table:
         """Search for fields matching a pattern."""
-        table = Table(title=f"🔍 Search Results for '{pattern}' in {index_name}", box=box.ROUNDED)
-        table.add_column("Field", style="cyan")
-        table.add_column("Type", style="green")
-        table.add_column("Analyzer", style="yellow")
-        table.add_column("Properties", style="magenta")
-        
-        if index_name not in self.data:
-            table.add_row("❌", "Index not found", "", "")
-            return table
-        
-        mappings = self.data[index_name].get("mappings", {})
-        properties = mappings.get("properties", {})
+        table = _search_table(index_name, pattern)
+        properties = self._index_ctx(index_name).properties
+        
+        # Plain substrings skip the regex engine entirely. str.lower() only
+        # agrees with re.IGNORECASE on ASCII (e.g. 'ſ' matches 's' only under
+        # the regex), so non-ASCII patterns or names take the regex path.
+        folded = self._folded_names(index_name)
+        if folded is not None and pattern.isascii() and re.escape(pattern) == pattern:
+            stats = self._field_stats(index_name)
+            matching = _literal_matches(
+                stats.field_names, stats.lower_names, folded, pattern.lower()
+            )
+        else:
+            search = re.compile(pattern, re.IGNORECASE).search
+            matching = [name for name in properties if search(name)]
         
-        import re
         matches = []
         
-        for field_name, field_config in properties.items():
-            if re.search(pattern, field_name, re.IGNORECASE):
-                field_type = field_config.get("type", "object")
-                analyzer = field_config.get("analyzer", "")
-                
-                # Collect properties
-                props = []
-                if field_config.get("index") is False:
-                    props.append("Not Indexed")
-                if field_config.get("doc_values") is False:
-                    props.append("No Doc Values")
-                if "fields" in field_config:
-                    props.append(f"{len(field_config['fields'])} sub-fields")
-                
-                matches.append((field_name, field_type, analyzer, ", ".join(props)))
+        for field_name in matching:
+            field_config = properties[field_name]
+            field_type = field_config.get("type", "object")
+            analyzer = field_config.get("analyzer", "")
+            
+            # Collect properties
+            props = []
+            if field_config.get("index") is False:
+                props.append("Not Indexed")
+            if field_config.get("doc_values") is False:
+                props.append("No Doc Values")
+            if "fields" in field_config:
+                props.append(f"{len(field_config['fields'])} sub-fields")
+            
+            matches.append((field_name, field_type, analyzer, ", ".join(props)))
         
         if not matches:
             table.add_row("ℹ️", "No matches found", "", "")
@@ -245,59 +482,51 @@ class OpenSearchIndexViewer:
         
         return table
     
-    def export_readable_json(self, index_name: str, output_file: Path):
-        """Export a clean, readable JSON summary."""
-        if index_name not in self.data:
-            self.console.print(f"❌ Index '{index_name}' not found", style="red")
-            return
+    @_require_index(lambda index_name: None)
+    def build_summary(self, index_name: str) -> Optional[Dict[str, Any]]:
+        """Build the clean, readable summary written by export_readable_json.
         
-        index_data = self.data[index_name]
-        settings = index_data.get("settings", {}).get("index", {})
-        mappings = index_data.get("mappings", {})
-        properties = mappings.get("properties", {})
+        Returns None for an unknown index.
+        """
+        ctx = self._index_ctx(index_name)
+        stats = self._field_stats(index_name)
+        settings = ctx.settings
+        properties = ctx.properties
         
         # Create clean summary
-        summary = {
+        summary: Dict[str, Any] = {
             "index_name": index_name,
-            "overview": {
-                "total_fields": len(properties),
-                "shards": settings.get("number_of_shards"),
-                "replicas": settings.get("number_of_replicas"),
-                "creation_date": settings.get("creation_date"),
-                "uuid": settings.get("uuid")
+            "overview": self._overview(index_name),
+            # Type counts and examples come from the cached field statistics
+            "field_types": {
+                field_type: {"count": count, "examples": list(stats.type_examples[field_type])}
+                for field_type, count in stats.type_counts.items()
             },
-            "field_types": {},
-            "fields": {},
+            "fields": _clean_fields(properties, stats.field_types),
             "analyzers": settings.get("analysis", {}).get("analyzer", {}),
             "tokenizers": settings.get("analysis", {}).get("tokenizer", {})
         }
         
-        # Count field types
-        for field_name, field_config in properties.items():
-            field_type = field_config.get("type", "object")
-            if field_type not in summary["field_types"]:
-                summary["field_types"][field_type] = {"count": 0, "examples": []}
-            
-            summary["field_types"][field_type]["count"] += 1
-            if len(summary["field_types"][field_type]["examples"]) < 5:
-                summary["field_types"][field_type]["examples"].append(field_name)
-        
-        # Clean field information
-        for field_name, field_config in properties.items():
-            clean_config = {
-                "type": field_config.get("type", "object"),
-                "analyzer": field_config.get("analyzer"),
-                "search_analyzer": field_config.get("search_analyzer"),
-                "normalizer": field_config.get("normalizer"),
-                "indexed": field_config.get("index", True),
-                "doc_values": field_config.get("doc_values", True),
-                "sub_fields": list(field_config.get("fields", {}).keys()) if "fields" in field_config else []
-            }
-            # Remove None values
-            summary["fields"][field_name] = {k: v for k, v in clean_config.items() if v is not None}
-        
-        # Write to file
-        with open(output_file, 'w') as f:
-            json.dump(summary, f, indent=2, sort_keys=True)
-        
-        self.console.print(f"✅ Exported readable summary to: {output_file}", style="green")
\ No newline at end of file
+        return summary
+    
+    @_require_index(_report_missing_export)
+    def export_readable_json(
+        self, index_name: str, output_file: Path, summary: Optional[Dict[str, Any]] = None
+    ):
+        """Export a clean, readable JSON summary.
+        
+        A summary previously returned by build_summary can be passed in to
+        skip rebuilding it.
+        """
+        if summary is None:
+            summary = self.build_summary(index_name)
+            assert summary is not None
+        
+        self.write_summary(summary, output_file)
+        _console.print(f"✅ Exported readable summary to: {output_file}", style="green")
+    
+    @staticmethod
+    def write_summary(summary: Dict[str, Any], output_file: Path) -> None:
+        """Write a summary built by build_summary to a JSON file."""
+        with open(output_file, 'wb') as f:
+            f.write(_dump_json(summary))
\ No newline at end of file
@@ -0,0 +1,68 @@
+"""Tests for the persistent summary cache."""
+
+import dbm
+import json
+import pytest
+from opensearch_index_viewer import cache as cache_module
+from opensearch_index_viewer.cache import SummaryCache, default_cache_dir
+
+
+@pytest.fixture
+def index_file(tmp_path):
+    """Create a temporary JSON file to key cache entries on."""
+    json_file = tmp_path / "indexes.json"
+    json_file.write_text(json.dumps({"test-index": {}}))
+    return json_file
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """SummaryCache stored in a temporary directory."""
+    return SummaryCache(tmp_path / "cache")
+
+
+def test_default_cache_dir_env_override(tmp_path, monkeypatch):
+    """Test that OSIV_CACHE_DIR overrides the default location."""
+    monkeypatch.setenv("OSIV_CACHE_DIR", str(tmp_path))
+    assert default_cache_dir() == tmp_path
+
+
+def test_cache_miss(cache, index_file):
+    """Test that an empty cache returns None."""
+    assert cache.get(index_file, "test-index") is None
+
+
+def test_cache_round_trip(cache, index_file):
+    """Test storing and retrieving a summary."""
+    summary = {"index_name": "test-index", "fields": {"name": {"type": "text"}}}
+    cache.set(index_file, "test-index", summary)
+    
+    assert cache.get(index_file, "test-index") == summary
+    assert cache.get(index_file, "other-index") is None
+
+
+def test_cache_invalidated_when_file_changes(cache, index_file):
+    """Test that entries are not returned once the file content changes."""
+    cache.set(index_file, "test-index", {"index_name": "test-index"})
+    index_file.write_text(json.dumps({"test-index": {"mappings": {}}}))
+    
+    assert cache.get(index_file, "test-index") is None
+
+
+def test_cache_drops_entries_for_old_file_versions(cache, index_file):
+    """Test that storing a summary for a changed file discards the old entries."""
+    cache.set(index_file, "test-index", {"index_name": "test-index"})
+    index_file.write_text(json.dumps({"new-index": {}}))
+    cache.set(index_file, "new-index", {"index_name": "new-index"})
+    
+    with dbm.open(cache._db_path(index_file), 'r') as db:
+        assert sorted(db.keys()) == [b"index:new-index", b"stamp"]
+    assert cache.get(index_file, "new-index") == {"index_name": "new-index"}
+
+
+def test_cache_invalidated_by_version(cache, index_file, monkeypatch):
+    """Test that entries written by another package version are not reused."""
+    cache.set(index_file, "test-index", {"index_name": "test-index"})
+    monkeypatch.setattr(cache_module, "__version__", "0.0.0-other")
+    
+    assert cache.get(index_file, "test-index") is None
@@ -1,10 +1,24 @@
 """Tests for the CLI interface."""
 
 import json
+import os
+import subprocess
+import sys
+import threading
 import pytest
 from typer.testing import CliRunner
 from pathlib import Path
-from opensearch_index_viewer.cli import app
+from opensearch_index_viewer.cache import SummaryCache
+from opensearch_index_viewer import cli
+from opensearch_index_viewer.cli import (
+    app, load_index_data, load_index_lazy, load_index_names, load_viewer, top_level_keys
+)
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Keep the summary cache out of the user's cache directory."""
+    monkeypatch.setenv("OSIV_CACHE_DIR", str(tmp_path / "cache"))
 
 
 @pytest.fixture
@@ -116,6 +130,43 @@ def test_view_command_with_export(sample_json_file, tmp_path):
     assert exported_data["index_name"] == "test-index"
 
 
+def test_view_command_export_only(sample_json_file, tmp_path):
+    """Test exporting with every optional component hidden."""
+    export_file = tmp_path / "export.json"
+    runner = CliRunner()
+    result = runner.invoke(app, [
+        "view", str(sample_json_file),
+        "--index", "test-index",
+        "--no-tree", "--no-summary", "--no-analyzers",
+        "--export", str(export_file)
+    ])
+    
+    assert result.exit_code == 0
+    assert "Index Overview" in result.stdout
+    assert "Field Types Summary" not in result.stdout
+    assert "Analyzers" not in result.stdout
+    
+    with open(export_file, 'r') as f:
+        exported_data = json.load(f)
+    
+    assert exported_data["field_types"]["text"] == {"count": 1, "examples": ["name"]}
+
+
+def test_view_command_overview_only_skips_field_stats(sample_json_file):
+    """Test that showing only the overview never derives field statistics."""
+    runner = CliRunner()
+    result = runner.invoke(app, [
+        "view", str(sample_json_file),
+        "--index", "test-index",
+        "--no-tree", "--no-summary", "--no-analyzers"
+    ])
+    
+    assert result.exit_code == 0
+    assert "Index Overview" in result.stdout
+    viewer = load_viewer(sample_json_file, ["test-index"])
+    assert viewer._field_stats.cache_info().currsize == 0
+
+
 def test_compare_command(sample_json_file):
     """Test the compare command."""
     runner = CliRunner()
@@ -156,4 +207,177 @@ def test_compare_command_missing_index(sample_json_file):
     ])
     
     assert result.exit_code == 1
-    assert "not found" in result.stdout
\ No newline at end of file
+    assert "not found" in result.stdout
+
+
+def test_view_command_invalid_json(tmp_path):
+    """Test the view command with a file that is not valid JSON."""
+    bad_file = tmp_path / "bad.json"
+    bad_file.write_text("{not json")
+    
+    runner = CliRunner()
+    result = runner.invoke(app, ["view", str(bad_file)])
+    
+    assert result.exit_code == 1
+    assert "Invalid JSON" in result.stdout
+
+
+def test_view_command_empty_file(tmp_path):
+    """Test the view command with an empty file."""
+    empty_file = tmp_path / "empty.json"
+    empty_file.write_bytes(b"")
+    
+    runner = CliRunner()
+    result = runner.invoke(app, ["view", str(empty_file)])
+    
+    assert result.exit_code == 1
+    assert "Invalid JSON" in result.stdout
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="requires named pipes")
+def test_load_index_data_from_pipe(tmp_path):
+    """Test loading index data from a pipe, which cannot be memory-mapped."""
+    fifo = tmp_path / "indexes.fifo"
+    os.mkfifo(fifo)
+    payload = json.dumps({"piped-index": {"mappings": {}}}).encode()
+    
+    def write_payload():
+        with open(fifo, 'wb') as f:
+            f.write(payload)
+    
+    writer = threading.Thread(target=write_payload)
+    writer.start()
+    try:
+        data = load_index_data(fifo)
+    finally:
+        writer.join()
+    
+    assert data == {"piped-index": {"mappings": {}}}
+
+
+def test_load_index_lazy_selected_indexes(sample_json_file):
+    """Test that only the requested indexes are loaded."""
+    data = load_index_lazy(sample_json_file, ["test-index", "missing"])
+    
+    assert list(data.keys()) == ["test-index"]
+    assert data["test-index"]["mappings"]["properties"]["name"] == {"type": "text"}
+
+
+def test_load_index_names(sample_json_file):
+    """Test loading only the top-level index names."""
+    assert load_index_names(sample_json_file) == ["test-index", "another-index"]
+
+
+@pytest.mark.parametrize("command", ["view", "list-indexes"])
+def test_top_level_array_is_invalid(tmp_path, command):
+    """Test that a top-level array is reported as invalid JSON."""
+    array_file = tmp_path / "array.json"
+    array_file.write_text("[1, 2]")
+    
+    runner = CliRunner()
+    result = runner.invoke(app, [command, str(array_file)])
+    
+    assert result.exit_code == 1
+    assert "Invalid JSON" in result.stdout
+
+
+def test_load_viewer_reuses_unchanged_file(sample_json_file):
+    """Test that the viewer is reused until the file changes."""
+    viewer = load_viewer(sample_json_file)
+    assert load_viewer(sample_json_file) is viewer
+    
+    sample_json_file.write_text(json.dumps({"new-index": {}}))
+    reloaded = load_viewer(sample_json_file)
+    assert list(reloaded.data.keys()) == ["new-index"]
+
+
+@pytest.mark.skipif(not os.path.exists("/dev/stdin"), reason="requires /dev/stdin")
+def test_view_command_reads_stdin():
+    """Test viewing indexes piped to /dev/stdin."""
+    payload = json.dumps({"piped-index": {"mappings": {}}})
+    result = subprocess.run(
+        [sys.executable, "-m", "opensearch_index_viewer", "view", "/dev/stdin", "--no-tree"],
+        input=payload, capture_output=True, text=True, encoding="utf-8",
+    )
+    
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "piped-index" in result.stdout
+
+
+def test_view_command_export_uses_cache(sample_json_file, tmp_path):
+    """Test that a second export is served from the summary cache."""
+    export_file = tmp_path / "export.json"
+    runner = CliRunner()
+    args = [
+        "view", str(sample_json_file), "--index", "test-index",
+        "--export", str(export_file), "--cache",
+    ]
+    
+    assert runner.invoke(app, args).exit_code == 0
+    first_export = export_file.read_bytes()
+    
+    export_file.unlink()
+    assert runner.invoke(app, args).exit_code == 0
+    assert export_file.read_bytes() == first_export
+    
+    cached = SummaryCache(tmp_path / "cache").get(sample_json_file, "test-index")
+    assert cached["index_name"] == "test-index"
+
+
+def test_view_command_cached_export_skips_loading(sample_json_file, tmp_path, monkeypatch):
+    """Test that an export-only run with a cache hit never parses the file."""
+    export_file = tmp_path / "export.json"
+    runner = CliRunner()
+    args = [
+        "view", str(sample_json_file), "--index", "test-index", "--export", str(export_file),
+        "--no-tree", "--no-summary", "--no-analyzers", "--cache",
+    ]
+    
+    first = runner.invoke(app, args)
+    assert first.exit_code == 0
+    first_export = export_file.read_bytes()
+    
+    def fail_to_load(*args, **kwargs):
+        raise AssertionError("the input file should not be loaded")
+    
+    monkeypatch.setattr(cli, "load_viewer", fail_to_load)
+    export_file.unlink()
+    second = runner.invoke(app, args)
+    
+    assert second.exit_code == 0
+    assert second.stdout == first.stdout
+    assert export_file.read_bytes() == first_export
+
+
+def test_view_command_export_without_cache(sample_json_file, tmp_path):
+    """Test that exports write nothing to the cache unless --cache is given."""
+    export_file = tmp_path / "export.json"
+    runner = CliRunner()
+    result = runner.invoke(app, [
+        "view", str(sample_json_file), "--index", "test-index", "--export", str(export_file)
+    ])
+    
+    assert result.exit_code == 0
+    assert export_file.exists()
+    assert not (tmp_path / "cache").exists()
+
+
+def test_top_level_keys():
+    """Test extracting top-level keys without keeping nested values."""
+    data = b'{"a": {"x": "}{\\"]"}, "b\\"c": [1, {"y": 2}], "d": 3, "e": "str"}'
+    assert top_level_keys(data) == ["a", 'b"c', "d", "e"]
+
+
+def test_top_level_keys_duplicates():
+    """Test that duplicate keys are reported once, in first-seen order."""
+    assert top_level_keys(b'{"b": 1, "a": {"b": 2}, "b": 3}') == ["b", "a"]
+
+
+@pytest.mark.parametrize("data", [
+    b"", b"[1, 2]", b'{"a": {', b'{"a": 1}}',
+    b'{"a": {}, "b": }', b'{"a": {"x": tru}, "b": 1}', b'{"a" 1}', b'{"a": 1,}', b'{"a": 1} x',
+])
+def test_top_level_keys_invalid(data):
+    """Test that malformed documents are rejected."""
+    with pytest.raises(ValueError):
+        top_level_keys(data)
@@ -3,7 +3,7 @@
 import json
 import pytest
 from pathlib import Path
-from opensearch_index_viewer.viewer import OpenSearchIndexViewer
+from opensearch_index_viewer.viewer import OpenSearchIndexViewer, _clean_fields, _literal_matches
 
 
 @pytest.fixture
@@ -50,7 +50,56 @@ def test_viewer_initialization(sample_data):
     """Test viewer initialization with data."""
     viewer = OpenSearchIndexViewer(sample_data)
     assert viewer.data == sample_data
-    assert viewer.console is not None
+
+
+def test_index_ctx_is_memoized(viewer):
+    """Test derived index state is computed once per index."""
+    ctx = viewer._index_ctx("test-index")
+    assert viewer._index_ctx("test-index") is ctx
+    assert ctx.properties["name"]["type"] == "text"
+    
+    stats = viewer._field_stats("test-index")
+    assert viewer._field_stats("test-index") is stats
+    assert stats.type_counts["text"] == 1
+    assert stats.type_examples["date"] == ["created_at"]
+    assert stats.field_names == ["name", "age", "created_at", "tags"]
+    assert stats.field_types == ["text", "integer", "date", "keyword"]
+    assert stats.lower_names == ["name", "age", "created_at", "tags"]
+
+
+def test_overview_and_analyzers_skip_field_stats(viewer):
+    """Test views that only need settings do not derive field statistics."""
+    viewer.get_index_overview("test-index")
+    viewer.get_analyzers_table("test-index")
+    assert viewer._field_stats.cache_info().currsize == 0
+
+
+def test_overview_values_are_memoized(viewer):
+    """Test overview values are formatted once per index."""
+    values = viewer._overview_values("test-index")
+    assert viewer._overview_values("test-index") is values
+    
+    creation_date, uuid_short = values
+    assert uuid_short == "test-uuid-12"
+    assert creation_date[:4] in ("2021", "2022")  # local timezone dependent
+
+
+def test_index_overview_non_string_settings():
+    """Test overviews of indexes with a numeric creation date and null UUID."""
+    viewer = OpenSearchIndexViewer({
+        "test-index": {
+            "mappings": {"properties": {"name": {"type": "text"}}},
+            "settings": {"index": {"creation_date": 1640995200000, "uuid": None}}
+        }
+    })
+    
+    overview = viewer.get_index_overview("test-index").renderable
+    assert "2021" in overview or "2022" in overview
+    assert "UUID:[/bold] Unknown" in overview
+    assert viewer.search_fields("test-index", "name").row_count == 1
+    
+    summary = viewer.build_summary("test-index")
+    assert OpenSearchIndexViewer.get_summary_overview(summary).renderable == overview
 
 
 def test_get_index_overview(viewer):
@@ -89,6 +138,11 @@ def test_format_field_label(viewer):
     assert "📝" in label  # text emoji
     assert "test_field" in label
     assert "text" in label
+    assert "[cyan]test_field[/cyan]" in label
+    
+    # Unknown types fall back to a neutral style
+    label = viewer._format_field_label("geo", {"type": "geo_point"})
+    assert label == "❓ [white]geo[/white] ([dim]geo_point[/dim])"
 
 
 def test_get_analyzers_table_no_analyzers(viewer):
@@ -98,6 +152,35 @@ def test_get_analyzers_table_no_analyzers(viewer):
     assert len(table.rows) >= 1
 
 
+def test_get_analyzers_table(sample_data):
+    """Test analyzers table rows for custom analyzers."""
+    sample_data["test-index"]["settings"]["index"]["analysis"] = {
+        "analyzer": {
+            "autocomplete": {"tokenizer": "edge_ngram", "filter": ["lowercase", "asciifolding"]},
+            "plain": {"type": "standard"}
+        }
+    }
+    table = OpenSearchIndexViewer(sample_data).get_analyzers_table("test-index")
+    
+    assert len(table.rows) == 2
+    assert table.columns[0]._cells == ["autocomplete", "plain"]
+    assert table.columns[1]._cells == ["custom", "standard"]
+    assert table.columns[3]._cells == ["lowercase, asciifolding", "None"]
+
+
+def test_tables_missing_index(viewer):
+    """Test that table views report a non-existent index in a single row."""
+    tables = [
+        viewer.get_analyzers_table("missing-index"),
+        viewer.get_field_types_summary("missing-index"),
+        viewer.search_fields("missing-index", "name"),
+    ]
+    for table in tables:
+        assert len(table.rows) == 1
+        assert "missing-index" in table.title
+        assert "Index not found" in [column._cells[0] for column in table.columns]
+
+
 def test_get_field_types_summary(viewer):
     """Test field types summary generation."""
     table = viewer.get_field_types_summary("test-index")
@@ -127,6 +210,27 @@ def test_search_fields_pattern(viewer):
     # Search for fields containing 'a' (should match 'name', 'age', 'created_at', 'tags')
     table = viewer.search_fields("test-index", "a")
     assert len(table.rows) == 4  # name, age, created_at, tags
+    
+    # Anchored regex only matches 'tags'
+    table = viewer.search_fields("test-index", "^t")
+    assert len(table.rows) == 1
+
+
+def test_search_fields_case_insensitive(viewer):
+    """Test that field search ignores case for literal and regex patterns."""
+    assert len(viewer.search_fields("test-index", "NAME").rows) == 1
+    assert len(viewer.search_fields("test-index", "^CREATED").rows) == 1
+
+
+@pytest.mark.parametrize("field_name, pattern", [("İd", "id"), ("ſum", "s"), ("σα", "ς")])
+def test_search_fields_non_ascii_case_insensitive(field_name, pattern):
+    """Test that non-ASCII names follow regex case folding, not str.lower()."""
+    viewer = OpenSearchIndexViewer({
+        "test-index": {"mappings": {"properties": {field_name: {"type": "keyword"}}}}
+    })
+    
+    table = viewer.search_fields("test-index", pattern)
+    assert list(table.columns[0].cells) == [field_name]
 
 
 def test_export_readable_json(viewer, tmp_path):
@@ -153,4 +257,79 @@ def test_export_readable_json_missing_index(viewer, tmp_path):
     viewer.export_readable_json("missing-index", output_file)
     
     # File should not be created
-    assert not output_file.exists()
\ No newline at end of file
+    assert not output_file.exists()
+
+
+def test_build_summary_missing_index(viewer):
+    """Test that no summary is built for a non-existent index."""
+    assert viewer.build_summary("missing-index") is None
+
+
+def test_export_readable_json_field_details(viewer, tmp_path):
+    """Test field type counts and cleaned field entries in the export."""
+    output_file = tmp_path / "test_export.json"
+    viewer.export_readable_json("test-index", output_file)
+    
+    with open(output_file, 'r') as f:
+        exported_data = json.load(f)
+    
+    assert exported_data["field_types"]["text"] == {"count": 1, "examples": ["name"]}
+    assert exported_data["fields"]["name"] == {
+        "type": "text",
+        "analyzer": "standard",
+        "indexed": True,
+        "doc_values": True,
+        "sub_fields": []
+    }
+
+
+def test_export_readable_json_format(tmp_path):
+    """Test the export is sorted, 2-space indented UTF-8 JSON."""
+    viewer = OpenSearchIndexViewer({"idx": {"mappings": {"properties": {"prénom": {"type": "text"}}}}})
+    output_file = tmp_path / "test_export.json"
+    viewer.export_readable_json("idx", output_file)
+    
+    content = output_file.read_text(encoding="utf-8")
+    assert content == json.dumps(json.loads(content), indent=2, sort_keys=True, ensure_ascii=False)
+    assert "prénom" in content
+
+
+def test_literal_matches():
+    """Test bulk substring matching over joined field names."""
+    names = ["userId", "userName", "email", "createdAt"]
+    lower_names = [name.lower() for name in names]
+    folded = "\n".join(lower_names)
+    
+    assert _literal_matches(names, lower_names, folded, "user") == ["userId", "userName"]
+    assert _literal_matches(names, lower_names, folded, "at") == ["createdAt"]
+    assert _literal_matches(names, lower_names, folded, "missing") == []
+    assert _literal_matches(names, lower_names, folded, "") == names
+
+
+def test_literal_matches_bulk_scan():
+    """Test that bulk scan hits map back to the right names."""
+    names = [f"field_{i:03d}" for i in range(200)]
+    names[7] = "userId"
+    names[120] = "parentUser"
+    names[121] = "userName"
+    names[199] = "lastUser"
+    lower_names = [name.lower() for name in names]
+    folded = "\n".join(lower_names)
+    
+    expected = ["userId", "parentUser", "userName", "lastUser"]
+    assert _literal_matches(names, lower_names, folded, "user") == expected
+    assert _literal_matches(names, lower_names, folded, "field_00") == names[:7] + names[8:10]
+
+
+def test_clean_fields():
+    """Test exported field entries drop None values and list sub-fields."""
+    properties = {
+        "title": {"type": "text", "fields": {"raw": {"type": "keyword"}}, "normalizer": None},
+        "blob": {"type": "binary", "index": False, "doc_values": None}
+    }
+    fields = _clean_fields(properties, ["text", "binary"])
+    
+    assert fields["title"] == {
+        "type": "text", "indexed": True, "doc_values": True, "sub_fields": ["raw"]
+    }
+    assert fields["blob"] == {"type": "binary", "indexed": False, "sub_fields": []}